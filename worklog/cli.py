@@ -12,20 +12,27 @@ This module:
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 from datetime import date, timedelta
-from pathlib import Path
+from functools import cache, lru_cache
+from operator import itemgetter
 
 from . import __version__
-from .models import WorkEntry
-from .reports import minutes_to_hhmm, summary, totals_by_project
-from .storage import add_entry, delete_entry, load_entries
+
+# json, pathlib, sqlite3 (via .storage) and .reports are imported inside the
+# command handlers, so "worklog --help" and "worklog --version" stay fast.
+
+
+@lru_cache(maxsize=256)
+def _cached_fromiso(text: str) -> date:
+    """date.fromisoformat, cached for repeated date strings."""
+    return date.fromisoformat(text)
 
 
 def parse_date_iso(text: str) -> date:
     """Convert 'YYYY-MM-DD' into a date object, or raise an argparse error."""
     try:
-        return date.fromisoformat(text)
+        return _cached_fromiso(text)
     except ValueError as e:
         raise argparse.ArgumentTypeError(
             "Date must be YYYY-MM-DD, for example 2026-01-26."
@@ -34,6 +41,10 @@ def parse_date_iso(text: str) -> date:
 
 def parse_minutes(text: str) -> int:
     """Convert text to int minutes and validate it."""
+    # Fast path: plain ASCII digits are always a valid, non-negative number.
+    if text.isascii() and text.isdigit():
+        return int(text)
+
     try:
         minutes = int(text)
     except ValueError as e:
@@ -47,42 +58,47 @@ def parse_minutes(text: str) -> int:
     return minutes
 
 
-def filter_by_date_range(entries: list[WorkEntry], start: date, end: date) -> list[WorkEntry]:
-    """Return only entries where start <= entry.day <= end (inclusive)."""
-    if end < start:
-        start, end = end, start  # swap if user gave them backwards
-    return [e for e in entries if start <= e.day <= end]
+def parse_limit(text: str) -> int:
+    """Convert text to a positive int for --limit, or raise an argparse error."""
+    try:
+        limit = int(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            "Limit must be a whole number, for example 10."
+        ) from e
+
+    if limit <= 0:
+        raise argparse.ArgumentTypeError("Limit must be at least 1.")
+
+    return limit
 
 
 def cmd_list(args: argparse.Namespace) -> None:
     """List entries, optionally filtered by project (newest first)."""
-    entries = load_entries()
+    from .storage import list_entries
 
-    if args.project is not None:
-        entries = [e for e in entries if e.project == args.project]
+    entries = list_entries(project=args.project, limit=args.limit)
 
     if not entries:
         print("No entries.")
         return
 
-    entries_sorted = sorted(entries, key=lambda e: e.day, reverse=True)
-    for e in entries_sorted:
-        print(f"{e.id}) {e.day.isoformat()} | {e.project} | {e.minutes} min")
+    lines = [f"{e.id}) {e.day.isoformat()} | {e.project} | {e.minutes} min" for e in entries]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_totals(args: argparse.Namespace) -> None:
     """Show total minutes per project, optionally filtered by a single project."""
-    entries = load_entries()
+    from .reports import minutes_to_hhmm
+    from .storage import load_totals_by_project
 
-    if args.project is not None:
-        entries = [e for e in entries if e.project == args.project]
+    totals = load_totals_by_project(project=args.project)
 
-    if not entries:
+    if not totals:
         print("No entries.")
         return
 
-    totals = totals_by_project(entries)
-    items_sorted = sorted(totals.items(), key=lambda x: x[1], reverse=True)
+    items_sorted = sorted(totals.items(), key=itemgetter(1), reverse=True)
 
     grand_total = 0
     for project, mins in items_sorted:
@@ -94,14 +110,19 @@ def cmd_totals(args: argparse.Namespace) -> None:
 
 def cmd_add(args: argparse.Namespace) -> None:
     """Add a single entry."""
-    entry = WorkEntry(id=None, day=args.date, project=args.project, minutes=args.minutes)
-    add_entry(entry)
+    from .models import WorkEntry
+    from .storage import add_entry
+
+    entry = add_entry(
+        WorkEntry(id=None, day=args.date, project=args.project, minutes=args.minutes)
+    )
     print(f"Added entry with id={entry.id}")
 
 
 def cmd_report(args: argparse.Namespace) -> None:
     """Totals by project in a date range (defaults to last 7 days)."""
-    entries = load_entries()
+    from .reports import ZERO_HHMM, minutes_to_hhmm
+    from .storage import load_totals_and_count
 
     if args.start is None or args.end is None:
         today = date.today()
@@ -111,51 +132,55 @@ def cmd_report(args: argparse.Namespace) -> None:
         start = args.start
         end = args.end
 
-    entries_in_range = filter_by_date_range(entries, start, end)
+    low, high = (start, end) if start <= end else (end, start)  # user may give them backwards
+    totals, count = load_totals_and_count(low, high)
 
-    report: dict[str, object] = {
-        "start": start.isoformat(),
-        "end": end.isoformat(),
-        "count": len(entries_in_range),
-        "totals_by_project": {},
-        "grand_total_minutes": 0,
-        "totals_by_project_hhmm": {},
-        "grand_total_hhmm": "0:00",
-    }
+    totals_hhmm: dict[str, str] = {}
+    grand_total = 0
+    grand_total_hhmm = ZERO_HHMM
 
-    if not entries_in_range:
+    if not totals:
         print(f"No entries in range {start.isoformat()} to {end.isoformat()}.")
     else:
-        totals = totals_by_project(entries_in_range)
-        items_sorted = sorted(totals.items(), key=lambda x: x[1], reverse=True)
+        items_sorted = sorted(totals.items(), key=itemgetter(1), reverse=True)
 
-        grand_total = 0
-        print(f"Report {start.isoformat()} to {end.isoformat()} ({len(entries_in_range)} entries)")
+        lines = [f"Report {start.isoformat()} to {end.isoformat()} ({count} entries)"]
         for project, mins in items_sorted:
+            hhmm = minutes_to_hhmm(mins)
             grand_total += mins
-            print(f"- {project}: {mins} min ({minutes_to_hhmm(mins)})")
-            report["totals_by_project"][project] = mins  # type: ignore[index]
+            totals_hhmm[project] = hhmm
+            lines.append(f"- {project}: {mins} min ({hhmm})")
 
-        report["grand_total_minutes"] = grand_total
-        report["grand_total_hhmm"] = minutes_to_hhmm(grand_total)
-        report["totals_by_project_hhmm"] = {
-            project: minutes_to_hhmm(mins)
-            for project, mins in totals.items()
-        }
+        grand_total_hhmm = minutes_to_hhmm(grand_total)
+        lines.append(f"Total: {grand_total} min ({grand_total_hhmm})")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        print(f"Total: {grand_total} min ({minutes_to_hhmm(grand_total)})")
+    report: dict[str, object] = {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "count": count,
+        "totals_by_project": totals,
+        "grand_total_minutes": grand_total,
+        "totals_by_project_hhmm": totals_hhmm,
+        "grand_total_hhmm": grand_total_hhmm,
+    }
 
     if args.json is not None:
+        import json
+        from pathlib import Path
+
         out_path = Path(args.json)
-        out_text = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
-        out_path.write_text(out_text, encoding="utf-8")
+        with out_path.open("w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
         print(f"Wrote JSON report to {out_path.resolve()}")
 
 
 def cmd_summary(args: argparse.Namespace) -> None:
     """Show overall summary statistics."""
-    entries = load_entries()
-    data = summary(entries)
+    from .reports import minutes_to_hhmm
+    from .storage import load_summary
+
+    data = load_summary()
 
     print("Summary")
     print(f"- Entries: {data['entries']}")
@@ -168,12 +193,47 @@ def cmd_summary(args: argparse.Namespace) -> None:
 
 def cmd_delete(args: argparse.Namespace) -> None:
     """Delete an entry by id."""
+    from .storage import delete_entry
+
     delete_entry(args.id)
     print(f"Deleted entry with id={args.id}")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Create the main parser and subcommands."""
+def cmd_import(args: argparse.Namespace) -> None:
+    """Import entries from a CSV file with date,project,minutes columns."""
+    import csv
+
+    from .models import WorkEntry
+    from .storage import add_entries
+
+    # utf-8-sig also strips the BOM that Excel on Windows writes
+    try:
+        with open(args.csv, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+    except OSError as e:
+        sys.exit(f"Cannot read CSV file {args.csv}: {e.strerror}")
+    except UnicodeDecodeError:
+        sys.exit(f"Cannot read CSV file {args.csv}: not a UTF-8 text file")
+    except csv.Error as e:
+        sys.exit(f"Cannot read CSV file {args.csv}: {e}")
+
+    entries = [e for e in map(WorkEntry.from_csv_row, rows) if e is not None]
+    add_entries(entries)
+
+    skipped = len(rows) - len(entries)
+    if skipped:
+        print(f"Imported {len(entries)} entries from {args.csv} (skipped {skipped} invalid rows)")
+    else:
+        print(f"Imported {len(entries)} entries from {args.csv}")
+
+
+# Subcommand names, so main() can tell which one subparser it needs
+COMMANDS = ("list", "totals", "add", "report", "summary", "delete", "import")
+
+
+@cache
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Create the main parser and subcommands (only `command`'s, if given)."""
     parser = argparse.ArgumentParser(
         prog="worklog",
         description="Track work time and generate summaries.",
@@ -183,6 +243,7 @@ def build_parser() -> argparse.ArgumentParser:
             "  py -m worklog list\n"
             "  py -m worklog totals\n"
             "  py -m worklog report --start 2026-01-01 --end 2026-01-31 --json january.json\n"
+            "  py -m worklog import --csv worklog/work_log.csv\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -198,46 +259,69 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # list
-    p_list = subparsers.add_parser("list", help="List entries (newest first).")
-    p_list.add_argument("--project", help="Only show entries for this project.")
-    p_list.set_defaults(func=cmd_list)
+    if command in (None, "list"):
+        p_list = subparsers.add_parser("list", help="List entries (newest first).")
+        p_list.add_argument("--project", help="Only show entries for this project.")
+        p_list.add_argument("--limit", type=parse_limit, help="Only show the newest N entries.")
+        p_list.set_defaults(func=cmd_list)
 
     # totals
-    p_totals = subparsers.add_parser("totals", help="Show totals by project.")
-    p_totals.add_argument("--project", help="Only total one project.")
-    p_totals.set_defaults(func=cmd_totals)
+    if command in (None, "totals"):
+        p_totals = subparsers.add_parser("totals", help="Show totals by project.")
+        p_totals.add_argument("--project", help="Only total one project.")
+        p_totals.set_defaults(func=cmd_totals)
 
     # add
-    p_add = subparsers.add_parser("add", help="Add one entry.")
-    p_add.add_argument("--date", required=True, type=parse_date_iso, help="Date as YYYY-MM-DD.")
-    p_add.add_argument("--project", required=True, help="Project name, for example Thesis.")
-    p_add.add_argument("--minutes", required=True, type=parse_minutes, help="Minutes as a whole number.")
-    p_add.set_defaults(func=cmd_add)
+    if command in (None, "add"):
+        p_add = subparsers.add_parser("add", help="Add one entry.")
+        p_add.add_argument("--date", required=True, type=parse_date_iso, help="Date as YYYY-MM-DD.")
+        p_add.add_argument("--project", required=True, help="Project name, for example Thesis.")
+        p_add.add_argument("--minutes", required=True, type=parse_minutes, help="Minutes as a whole number.")
+        p_add.set_defaults(func=cmd_add)
 
     # report
-    p_report = subparsers.add_parser(
-        "report",
-        help="Totals by project for a date range (default last 7 days).",
-    )
-    p_report.add_argument("--start", type=parse_date_iso, help="Start date YYYY-MM-DD (optional).")
-    p_report.add_argument("--end", type=parse_date_iso, help="End date YYYY-MM-DD (optional).")
-    p_report.add_argument("--json", help="Write the report to a JSON file (optional).")
-    p_report.set_defaults(func=cmd_report)
+    if command in (None, "report"):
+        p_report = subparsers.add_parser(
+            "report",
+            help="Totals by project for a date range (default last 7 days).",
+        )
+        p_report.add_argument("--start", type=parse_date_iso, help="Start date YYYY-MM-DD (optional).")
+        p_report.add_argument("--end", type=parse_date_iso, help="End date YYYY-MM-DD (optional).")
+        p_report.add_argument("--json", help="Write the report to a JSON file (optional).")
+        p_report.set_defaults(func=cmd_report)
 
     # summary
-    p_summary = subparsers.add_parser("summary", help="Show overall summary statistics.")
-    p_summary.set_defaults(func=cmd_summary)
+    if command in (None, "summary"):
+        p_summary = subparsers.add_parser("summary", help="Show overall summary statistics.")
+        p_summary.set_defaults(func=cmd_summary)
 
     # delete
-    p_delete = subparsers.add_parser("delete", help="Delete entry by id.")
-    p_delete.add_argument("--id", required=True, type=int, help="ID of entry to delete.")
-    p_delete.set_defaults(func=cmd_delete)
+    if command in (None, "delete"):
+        p_delete = subparsers.add_parser("delete", help="Delete entry by id.")
+        p_delete.add_argument("--id", required=True, type=int, help="ID of entry to delete.")
+        p_delete.set_defaults(func=cmd_delete)
+
+    # import
+    if command in (None, "import"):
+        p_import = subparsers.add_parser("import", help="Import entries from a CSV file.")
+        p_import.add_argument(
+            "--csv",
+            required=True,
+            help="CSV file with a date,project,minutes header, for example work_log.csv.",
+        )
+        p_import.set_defaults(func=cmd_import)
 
     return parser
 
 
 def main(argv: list[str] | None = None) -> None:
     """Parse command-line arguments and run the chosen subcommand."""
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Build only the named subcommand's parser; fall back to all of them for
+    # --help, --version, a missing command or a typo.
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    parser = build_parser(command)
     args = parser.parse_args(argv)
     args.func(args)
@@ -1,6 +1,6 @@
 # worklog/models.py
 # Topic: dataclass model for one work entry
-# Goal: represent data cleanly, and convert to/from CSV rows
+# Goal: represent data cleanly, and convert to/from CSV rows and SQLite rows
 
 from __future__ import annotations
 
@@ -9,20 +9,26 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkEntry:
     id: Optional[int]  # None before insert
     day: date
     project: str
     minutes: int
 
+    @staticmethod
+    def from_db_tuple(t: tuple[int, str, str, int]) -> "WorkEntry":
+        # Convert an (id, day, project, minutes) row from SQLite.
+        # The database only holds validated values, so no checks here.
+        return WorkEntry(id=t[0], day=date.fromisoformat(t[1]), project=t[2], minutes=t[3])
 
     @staticmethod
-    def from_row(row: dict[str, str]) -> "WorkEntry | None":
+    def from_csv_row(row: dict[str, str]) -> "WorkEntry | None":
         # Convert CSV row text into a WorkEntry object.
-        day_text = row.get("date", "").strip()
-        project = row.get("project", "").strip()
-        minutes_text = row.get("minutes", "").strip()
+        # csv.DictReader fills missing trailing fields with None, hence "or".
+        day_text = (row.get("date") or "").strip()
+        project = (row.get("project") or "").strip()
+        minutes_text = (row.get("minutes") or "").strip()
 
         # Parse date (YYYY-MM-DD)
         try:
@@ -44,7 +50,7 @@ class WorkEntry:
         if project == "":
             project = "(no project)"
 
-        return WorkEntry(day=day_value, project=project, minutes=minutes_value)
+        return WorkEntry(id=None, day=day_value, project=project, minutes=minutes_value)
 
     def to_row(self) -> dict[str, str]:
         # Convert WorkEntry back to a CSV row (strings).
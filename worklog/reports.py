@@ -5,10 +5,16 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from datetime import date
+from functools import lru_cache
 
 from .models import WorkEntry
 
+# minutes_to_hhmm(0), for reports with no entries
+ZERO_HHMM = "0:00"
+
 
+@lru_cache(maxsize=4096)
 def minutes_to_hhmm(total_minutes: int) -> str:
     # Convert minutes into "H:MM"
     hours = total_minutes // 60
@@ -18,6 +24,7 @@ def minutes_to_hhmm(total_minutes: int) -> str:
 
 def totals_by_project(entries: list[WorkEntry]) -> dict[str, int]:
     # Return a dict mapping project -> total minutes.
+    # The CLI sums in SQL (storage.load_totals_by_project); this is for in-memory lists.
     totals = defaultdict(int)
 
     for e in entries:
@@ -25,8 +32,6 @@ def totals_by_project(entries: list[WorkEntry]) -> dict[str, int]:
 
     return dict(totals)
 
-from datetime import date
-
 
 def summary(entries: list["WorkEntry"]) -> dict[str, int | float]:
     """
@@ -3,24 +3,42 @@
 
 from __future__ import annotations
 
+import atexit
+from collections.abc import Iterable
+from dataclasses import replace
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 import sqlite3
 
 from .models import WorkEntry
-from datetime import date
-
 
 
 BASE_DIR = Path(__file__).resolve().parent
 DB_FILE = BASE_DIR / "work_log.db"
 
 
+@lru_cache(maxsize=1)
 def get_connection() -> sqlite3.Connection:
-    return sqlite3.connect(DB_FILE)
+    # One connection per process; "with conn:" only commits, it does not close.
+    conn = sqlite3.connect(DB_FILE)
+    # WAL + NORMAL: a commit no longer waits for a full fsync of the database file
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-8000")  # about 8 MB of page cache
+    conn.execute("PRAGMA temp_store=MEMORY")  # e.g. the GROUP BY b-tree in reports
+    atexit.register(conn.close)
+    _create_schema(conn)
+    return conn
 
 
 def initialize_database() -> None:
-    with get_connection() as conn:
+    # The schema is created when the cached connection is first opened.
+    get_connection()
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    with conn:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS entries (
@@ -31,54 +49,143 @@ def initialize_database() -> None:
             )
             """
         )
+        # Covering index for reports: the date range, GROUP BY project and
+        # SUM(minutes) are all answered from the index without table lookups.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_day_project_minutes"
+            " ON entries (day, project, minutes)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_project ON entries (project)"
+        )
 
 
-# ---------- CRUD ----------
+def _entry_from_row(cursor: sqlite3.Cursor, row: tuple) -> WorkEntry:
+    # Row factory for "SELECT id, day, project, minutes": builds entries while fetching.
+    return WorkEntry.from_db_tuple(row)
+
 
-def add_entry(entry: WorkEntry) -> None:
-    initialize_database()
+# ---------- CRUD ----------
 
+def add_entry(entry: WorkEntry) -> WorkEntry:
+    # WorkEntry is frozen, so return a copy carrying the new id.
     with get_connection() as conn:
         cursor = conn.execute(
             "INSERT INTO entries (day, project, minutes) VALUES (?, ?, ?)",
             (entry.day.isoformat(), entry.project, entry.minutes),
         )
-        entry.id = cursor.lastrowid
+    return replace(entry, id=cursor.lastrowid)
+
+
+def add_entries(entries: Iterable[WorkEntry]) -> None:
+    # Insert many entries in one transaction (ids are not written back).
+    with get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO entries (day, project, minutes) VALUES (?, ?, ?)",
+            [(e.day.isoformat(), e.project, e.minutes) for e in entries],
+        )
 
 
 def load_entries() -> list[WorkEntry]:
-    initialize_database()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _entry_from_row
+        return list(cursor.execute("SELECT id, day, project, minutes FROM entries"))
+
+
+def _where_clause(
+    start: date | None = None,
+    end: date | None = None,
+    project: str | None = None,
+) -> tuple[str, list[object]]:
+    # Build a WHERE clause (and its parameters) from the optional filters.
+    conditions: list[str] = []
+    params: list[object] = []
+
+    if start is not None:
+        conditions.append("day >= ?")
+        params.append(start.isoformat())
+    if end is not None:
+        conditions.append("day <= ?")
+        params.append(end.isoformat())
+    if project is not None:
+        conditions.append("project = ?")
+        params.append(project)
+
+    if not conditions:
+        return "", params
+    return " WHERE " + " AND ".join(conditions), params
+
+
+def list_entries(project: str | None = None, limit: int | None = None) -> list[WorkEntry]:
+    # Newest first; entries on the same day keep insertion order.
+    where, params = _where_clause(project=project)
+    sql = "SELECT id, day, project, minutes FROM entries" + where + " ORDER BY day DESC, id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _entry_from_row
+        return list(cursor.execute(sql, params))
+
+
+def load_summary() -> dict[str, int | float]:
+    # Same result as reports.summary(load_entries()), computed in one SQL query.
+    with get_connection() as conn:
+        count, total_minutes, days = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(minutes), 0), COUNT(DISTINCT day) FROM entries"
+        ).fetchone()
+
+    return {
+        "entries": count,
+        "total_minutes": total_minutes,
+        "days": days,
+        "avg_minutes_per_day": total_minutes / days if days else 0.0,
+    }
+
+
+def load_totals_by_project(
+    start: date | None = None,
+    end: date | None = None,
+    project: str | None = None,
+) -> dict[str, int]:
+    # Same result as reports.totals_by_project, but SQLite does the summing.
+    where, params = _where_clause(start, end, project)
 
     with get_connection() as conn:
         rows = conn.execute(
-            "SELECT id, day, project, minutes FROM entries"
+            "SELECT project, SUM(minutes) FROM entries" + where + " GROUP BY project",
+            params,
         ).fetchall()
 
-    entries: list[WorkEntry] = []
+    return dict(rows)
 
-    for row_id, day, project, minutes in rows:
-        entries.append(
-            WorkEntry(
-                id=row_id,
-                day=date.fromisoformat(day),
-                project=project,
-                minutes=minutes,
-            )
-        )
 
-    return entries
+def load_totals_and_count(
+    start: date | None = None,
+    end: date | None = None,
+    project: str | None = None,
+) -> tuple[dict[str, int], int]:
+    # Totals by project plus the number of matching entries, from one GROUP BY query.
+    where, params = _where_clause(start, end, project)
+
+    with get_connection() as conn:
+        rows = conn.execute(
+            "SELECT project, SUM(minutes), COUNT(*) FROM entries" + where + " GROUP BY project",
+            params,
+        ).fetchall()
 
+    totals = {project_name: minutes for project_name, minutes, _ in rows}
+    return totals, sum(row[2] for row in rows)
 
 
 def delete_all_entries() -> None:
-    initialize_database()
-
     with get_connection() as conn:
         conn.execute("DELETE FROM entries")
 
 def delete_entry(entry_id: int) -> None:
-    initialize_database()
-
     with get_connection() as conn:
         conn.execute(
             "DELETE FROM entries WHERE id = ?",